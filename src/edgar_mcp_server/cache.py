@@ -0,0 +1,61 @@
+"""
+On-disk cache for SEC filing data
+Filings are immutable once accessioned, so entries never expire
+Entries are stored as zstd frames
+"""
+
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+import zstandard
+
+logger = logging.getLogger("edgartools-mcp-server")
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+# Fast enough that disk IO, not compression, dominates
+ZSTD_LEVEL = 3
+
+
+class FileCache:
+    """Stores filing payloads at <root>/<ticker>/<key>.<ext>.zst"""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).expanduser()
+
+    def _path(self, ticker: str, key: str, ext: str) -> Path:
+        """Build the entry path, keeping user input from escaping the cache root"""
+        return self.root / _UNSAFE_CHARS.sub("_", ticker) / f"{_UNSAFE_CHARS.sub('_', key)}.{ext}.zst"
+
+    def get(self, ticker: str, key: str, ext: str) -> Optional[bytes]:
+        """Return the cached bytes for an entry, or None on a miss"""
+        try:
+            data = self._path(ticker, key, ext).read_bytes()
+            # zstandard (de)compressors are not thread-safe, so each call gets its own
+            return zstandard.ZstdDecompressor().decompress(data)
+        except FileNotFoundError:
+            return None
+        except (OSError, zstandard.ZstdError) as e:
+            logger.warning(f"Error reading cache entry {key}: {str(e)}")
+            return None
+
+    def set(self, ticker: str, key: str, ext: str, data: bytes) -> None:
+        """Write an entry atomically so concurrent readers never see partial data"""
+        path = self._path(ticker, key, ext)
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(compressed)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Error writing cache entry {key}: {str(e)}")
@@ -5,12 +5,19 @@ Provides tools for accessing SEC EDGAR filings data through the edgartools libra
 """
 
 import asyncio
-import json
+import atexit
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime, date
 
+import jsonschema
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -22,6 +29,8 @@ from mcp.types import (
     LoggingLevel
 )
 
+from edgar_mcp_server.cache import FileCache
+
 try:
     from edgar import Company, set_identity, get_filings
     # from edgar.entities import Filing
@@ -54,6 +63,18 @@ except Exception as e:
     logger.error(f"Failed to set identity: {str(e)}")
     raise
 
+# Share one pooled HTTPX client across all edgartools requests
+try:
+    import httpx
+    from edgar import httpclient
+
+    httpclient.PERSISTENT_CLIENT = True
+    httpclient.DEFAULT_PARAMS["limits"] = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+    httpclient.DEFAULT_PARAMS["timeout"] = 30.0
+    atexit.register(httpclient.close_clients)
+except (ImportError, AttributeError) as e:
+    logger.warning(f"Shared HTTP client not configured: {str(e)}")
+
 
 def ensure_identity():
     """Ensure user identity is set for SEC compliance"""
@@ -62,156 +83,375 @@ def ensure_identity():
         raise RuntimeError("User identity not set. EDGAR_USER_EMAIL environment variable is required.")
 
 
+def _normalize_ticker(ticker: Optional[str]) -> Optional[str]:
+    """Normalize a user-supplied ticker so equivalent spellings share cache entries"""
+    if not ticker:
+        return ticker
+    return sys.intern(ticker.strip().upper())
+
+
+# In-process TTL cache for Company objects and their filings lists
+CACHE_TTL = float(os.getenv('EDGAR_CACHE_TTL', '600'))
+
+_company_cache: Dict[str, Tuple[float, Any]] = {}
+_filings_cache: Dict[str, Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(cache: Dict[Any, Tuple[float, Any]], key: Any, factory: Callable[[], Any]) -> Any:
+    """Return the cached value for key, calling factory when missing or expired"""
+    now = time.monotonic()
+    entry = cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    value = factory()
+    with _cache_lock:
+        # Drop expired entries so tickers that are never requested again don't stay in memory
+        for stale_key in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+            del cache[stale_key]
+        cache[key] = (now + CACHE_TTL, value)
+    return value
+
+
+def _get_company(ticker: str) -> Any:
+    """Get the Company for a ticker, cached for CACHE_TTL seconds"""
+    return _cached(_company_cache, ticker, lambda: Company(ticker))
+
+
+class _FilingsView:
+    """Selected rows of a filings collection, materialized as Filing objects on access"""
+
+    def __init__(self, filings: Any, rows: Sequence[int]):
+        self._filings = filings
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, item: Union[int, slice]) -> Any:
+        if isinstance(item, slice):
+            return [self._filings[row] for row in self._rows[item]]
+        return self._filings[self._rows[item]]
+
+    def head(self, n: int) -> List[Any]:
+        return self[:n]
+
+
+def _load_filings(ticker: str) -> Tuple[Any, Dict[str, List[int]]]:
+    """Load all filings for a ticker and index their rows by form type"""
+    filings = _get_company(ticker).get_filings()
+    by_form = defaultdict(list)
+    # Exact matches only, like Filings.filter(form=...): amendments such as 10-K/A get their own key
+    for row, form in enumerate(filings.data['form'].to_pylist()):
+        by_form[form].append(row)
+    return filings, dict(by_form)
+
+
+def _get_filings(ticker: str) -> Tuple[Any, Dict[str, List[int]]]:
+    """Get all filings for a ticker and their form index, cached for CACHE_TTL seconds"""
+    return _cached(_filings_cache, ticker, lambda: _load_filings(ticker))
+
+
+def _get_filtered(ticker: str, form: Optional[str]) -> _FilingsView:
+    """Get filings whose form exactly matches form for a ticker, or all filings if form is None"""
+    filings, by_form = _get_filings(ticker)
+    if form is None:
+        return _FilingsView(filings, range(len(filings)))
+    return _FilingsView(filings, by_form.get(form, []))
+
+
+# Worker pool for blocking edgartools calls; its size caps concurrent SEC requests
+MAX_WORKERS = int(os.getenv('EDGAR_MAX_WORKERS', '10'))
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="edgar-worker")
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking edgartools call on the worker pool, keeping the event loop free"""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, func, *args)
+
+
+# Persistent cache for filing text and parsed filings, keyed by accession number
+FILE_CACHE = FileCache(os.getenv('EDGAR_CACHE_DIR', '~/.edgar_mcp_cache'))
+
+# Filing text beyond this many characters is truncated
+MAX_TEXT_CHARS = 10000
+
+
+# orjson encodes str/int/float/bool/None and date/datetime natively
+_JSON_BASE_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+# Responses are read by models, so indentation is opt-in
+PRETTY_JSON = os.getenv('EDGAR_PRETTY', '0') == '1'
+_JSON_OPTIONS = _JSON_BASE_OPTIONS | orjson.OPT_INDENT_2 if PRETTY_JSON else _JSON_BASE_OPTIONS
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for values orjson cannot encode natively"""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _object_default(obj: Any) -> Any:
+    """orjson fallback that expands filing objects, leaving traversal to orjson"""
+    # Date subclasses such as pd.Timestamp reach here and carry an empty __dict__
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if hasattr(obj, '__dict__'):
+        return {key: value for key, value in obj.__dict__.items() if not key.startswith('_')}
+    return _json_default(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a response payload to JSON text"""
+    return orjson.dumps(obj, default=_json_default, option=_JSON_OPTIONS).decode()
+
+
+# Value kinds for serialize_filing_data, memoized per type
+_PRIMITIVE, _LIST, _OBJECT, _OTHER, _TO_DICT = range(5)
+_PRIMITIVES = (str, int, float, bool, type(None), date, datetime)
+_VALUE_KINDS: Dict[type, int] = {t: _PRIMITIVE for t in _PRIMITIVES}
+_VALUE_KINDS[list] = _LIST
+_NODE_KINDS: Dict[type, int] = {t: _OTHER for t in _PRIMITIVES}
+_MAX_DEPTH = 500
+
+
+def _value_kind(value: Any) -> int:
+    """Classify the type of an attribute value the first time it is seen"""
+    if isinstance(value, _PRIMITIVES):
+        kind = _PRIMITIVE
+    elif isinstance(value, list):
+        kind = _LIST
+    elif hasattr(value, '__dict__'):
+        kind = _OBJECT
+    else:
+        kind = _OTHER
+    _VALUE_KINDS[type(value)] = kind
+    return kind
+
+
+def _node_kind(node: Any) -> int:
+    """Classify the type of a node being converted the first time it is seen"""
+    if hasattr(node, 'to_dict'):
+        kind = _TO_DICT
+    elif hasattr(node, '__dict__'):
+        kind = _OBJECT
+    else:
+        kind = _OTHER
+    _NODE_KINDS[type(node)] = kind
+    return kind
+
+
 def serialize_filing_data(data: Any) -> Dict[str, Any]:
     """Convert filing data to JSON-serializable format"""
-    if hasattr(data, 'to_dict'):
-        return data.to_dict()
-    elif hasattr(data, '__dict__'):
+    root = [None]
+    stack = [(root, 0, data, 0)]
+    kinds = _VALUE_KINDS
+    node_kinds = _NODE_KINDS
+    while stack:
+        parent, slot, node, depth = stack.pop()
+        node_kind = node_kinds.get(type(node))
+        if node_kind is None:
+            node_kind = _node_kind(node)
+        if node_kind == _TO_DICT:
+            parent[slot] = node.to_dict()
+            continue
+        if node_kind == _OTHER:
+            parent[slot] = str(node)
+            continue
+        if depth >= _MAX_DEPTH:
+            raise ValueError("Filing data is nested too deeply to serialize")
+        depth += 1
         result = {}
-        for key, value in data.__dict__.items():
+        parent[slot] = result
+        for key, value in node.__dict__.items():
             if key.startswith('_'):
                 continue
-            if isinstance(value, (str, int, float, bool, type(None))):
+            kind = kinds.get(type(value))
+            if kind is None:
+                kind = _value_kind(value)
+            if kind == _PRIMITIVE:
                 result[key] = value
-            elif isinstance(value, (date, datetime)):
-                result[key] = value.isoformat()
-            elif isinstance(value, list):
-                result[key] = [serialize_filing_data(item) for item in value]
-            elif hasattr(value, '__dict__'):
-                result[key] = serialize_filing_data(value)
+            elif kind == _LIST:
+                items = [None] * len(value)
+                result[key] = items
+                stack.extend((items, i, item, depth) for i, item in enumerate(value))
+            elif kind == _OBJECT:
+                # Reserve the key so the output keeps attribute order
+                result[key] = None
+                stack.append((result, key, value, depth))
             else:
                 result[key] = str(value)
-        return result
-    else:
-        return str(data)
+    return root[0]
 
 
-@app.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available tools for SEC filing data access"""
-    tools = []
-    
-    if not EDGARTOOLS_AVAILABLE:
-        return [Tool(
-            name="error",
-            description="EdgarTools library not available. Please install it with: pip install edgartools",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )]
-    
-    tools.extend([
-        Tool(
-            name="get_company_info",
-            description="Get basic company information and recent filings",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Company ticker symbol (e.g., AAPL, MSFT)"
-                    }
+# Tool definitions are static, so build them once at import
+_ERROR_TOOLS = [Tool(
+    name="error",
+    description="EdgarTools library not available. Please install it with: pip install edgartools",
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
+)]
+
+_TOOLS = [
+    Tool(
+        name="get_company_info",
+        description="Get basic company information and recent filings",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "Company ticker symbol (e.g., AAPL, MSFT)"
+                }
+            },
+            "required": ["ticker"]
+        }
+    ),
+    Tool(
+        name="get_company_filings",
+        description="Get filings for a company with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "Company ticker symbol"
                 },
-                "required": ["ticker"]
-            }
-        ),
-        Tool(
-            name="get_company_filings",
-            description="Get filings for a company with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Company ticker symbol"
-                    },
-                    "form": {
-                        "type": "string",
-                        "description": "Filing form type (e.g., 10-K, 10-Q, 8-K, 4)"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of filings to return",
-                        "default": 10
-                    }
+                "form": {
+                    "type": "string",
+                    "description": "Filing form type (e.g., 10-K, 10-Q, 8-K, 4)"
                 },
-                "required": ["ticker"]
-            }
-        ),
-        Tool(
-            name="get_filing_text",
-            description="Extract text content from a specific filing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Company ticker symbol"
-                    },
-                    "form": {
-                        "type": "string",
-                        "description": "Filing form type (e.g., 10-K, 10-Q)"
-                    },
-                    "filing_index": {
-                        "type": "integer",
-                        "description": "Index of filing to retrieve (0 for most recent)",
-                        "default": 0
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of filings to return",
+                    "default": 10
+                }
+            },
+            "required": ["ticker"]
+        }
+    ),
+    Tool(
+        name="get_filing_text",
+        description="Extract text content from a specific filing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "Company ticker symbol"
                 },
-                "required": ["ticker", "form"]
-            }
-        ),
-        Tool(
-            name="get_insider_transactions",
-            description="Get insider transaction data (Form 4 filings)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Company ticker symbol"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of transactions to return",
-                        "default": 20
-                    }
+                "form": {
+                    "type": "string",
+                    "description": "Filing form type (e.g., 10-K, 10-Q)"
                 },
-                "required": ["ticker"]
-            }
-        ),
-        Tool(
-            name="get_financial_statements",
-            description="Extract financial statements from 10-K/10-Q filings",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Company ticker symbol"
-                    },
-                    "form": {
-                        "type": "string",
-                        "description": "Filing form type (10-K or 10-Q)",
-                        "enum": ["10-K", "10-Q"]
-                    },
-                    "filing_index": {
-                        "type": "integer",
-                        "description": "Index of filing to retrieve (0 for most recent)",
-                        "default": 0
-                    }
+                "filing_index": {
+                    "type": "integer",
+                    "description": "Index of filing to retrieve (0 for most recent)",
+                    "default": 0
+                }
+            },
+            "required": ["ticker", "form"]
+        }
+    ),
+    Tool(
+        name="get_insider_transactions",
+        description="Get insider transaction data (Form 4 filings)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "Company ticker symbol"
                 },
-                "required": ["ticker", "form"]
-            }
-        )
-    ])
-    
-    return tools
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of transactions to return",
+                    "default": 20
+                }
+            },
+            "required": ["ticker"]
+        }
+    ),
+    Tool(
+        name="get_financial_statements",
+        description="Extract financial statements from 10-K/10-Q filings",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticker": {
+                    "type": "string",
+                    "description": "Company ticker symbol"
+                },
+                "form": {
+                    "type": "string",
+                    "description": "Filing form type (10-K or 10-Q)",
+                    "enum": ["10-K", "10-Q"]
+                },
+                "filing_index": {
+                    "type": "integer",
+                    "description": "Index of filing to retrieve (0 for most recent)",
+                    "default": 0
+                }
+            },
+            "required": ["ticker", "form"]
+        }
+    )
+]
 
 
-@app.call_tool()
+_TOOL_SCHEMAS = {tool.name: tool.inputSchema for tool in _TOOLS}
+
+_JSON_TYPE_NAMES = {str: "string", int: "integer"}
+
+
+def _fast_validator(required: Tuple[str, ...], types: Dict[str, type]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """Build a validator for flat schemas of required keys and primitive types"""
+    def validate(arguments: Dict[str, Any]) -> Optional[str]:
+        for key in required:
+            if key not in arguments:
+                return f"{key!r} is a required property"
+        for key, expected in types.items():
+            if key in arguments:
+                value = arguments[key]
+                if not isinstance(value, expected) or isinstance(value, bool):
+                    return f"{value!r} is not of type {_JSON_TYPE_NAMES[expected]!r}"
+        return None
+    return validate
+
+
+# Hand-rolled validators for the ticker-keyed tools; other tools fall back to jsonschema
+_FAST_VALIDATORS = {
+    "get_company_info": _fast_validator(("ticker",), {"ticker": str}),
+    "get_company_filings": _fast_validator(("ticker",), {"ticker": str, "form": str, "limit": int}),
+    "get_insider_transactions": _fast_validator(("ticker",), {"ticker": str, "limit": int}),
+}
+
+
+def _validate_arguments(name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Validate tool arguments, returning an error message or None"""
+    validator = _FAST_VALIDATORS.get(name)
+    if validator is not None:
+        return validator(arguments)
+    try:
+        jsonschema.validate(instance=arguments, schema=_TOOL_SCHEMAS[name])
+    except jsonschema.ValidationError as e:
+        return e.message
+    return None
+
+
+@app.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available tools for SEC filing data access"""
+    return _TOOLS if EDGARTOOLS_AVAILABLE else _ERROR_TOOLS
+
+
+# Input is validated in call_tool so the ticker-keyed tools can skip jsonschema
+@app.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool calls"""
     
@@ -221,44 +461,47 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             text="EdgarTools library not available. Please install it with: pip install edgartools"
         )]
     
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
+    error = _validate_arguments(name, arguments)
+    if error is not None:
+        # Raised so the MCP wrapper reports it with isError=True, as its own validation does
+        raise ValueError(f"Input validation error: {error}")
+    
     try:
-        if name == "get_company_info":
-            return await handle_get_company_info(arguments)
-        elif name == "get_company_filings":
-            return await handle_get_company_filings(arguments)
-        elif name == "get_filing_text":
-            return await handle_get_filing_text(arguments)
-        elif name == "get_insider_transactions":
-            return await handle_get_insider_transactions(arguments)
-        elif name == "get_financial_statements":
-            return await handle_get_financial_statements(arguments)
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
     
     except Exception as e:
         logger.error(f"Error in tool {name}: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+def _load_company_info(ticker: str) -> Dict[str, Any]:
+    """Collect basic company details; reading them fetches the SEC submissions data on first use"""
+    company = _get_company(ticker)
+    return {
+        "name": getattr(company, 'name', 'N/A'),
+        "ticker": ticker,
+        "cik": getattr(company, 'cik', 'N/A'),
+        "sic": getattr(company, 'sic', 'N/A'),
+        "industry": getattr(company, 'industry', 'N/A')
+    }
+
+
 async def handle_get_company_info(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get basic company information"""
     ensure_identity()
     
-    ticker = arguments.get("ticker")
+    ticker = _normalize_ticker(arguments.get("ticker"))
     if not ticker:
         return [TextContent(type="text", text="Ticker is required")]
     
     try:
-        company = Company(ticker)
-        info = {
-            "name": getattr(company, 'name', 'N/A'),
-            "ticker": ticker,
-            "cik": getattr(company, 'cik', 'N/A'),
-            "sic": getattr(company, 'sic', 'N/A'),
-            "industry": getattr(company, 'industry', 'N/A')
-        }
+        info = await _run_blocking(_load_company_info, ticker)
         
-        return [TextContent(type="text", text=json.dumps(info, indent=2))]
+        return [TextContent(type="text", text=_dumps(info))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting company info: {str(e)}")]
 
@@ -267,7 +510,7 @@ async def handle_get_company_filings(arguments: Dict[str, Any]) -> List[TextCont
     """Get company filings with optional filtering"""
     ensure_identity()
     
-    ticker = arguments.get("ticker")
+    ticker = _normalize_ticker(arguments.get("ticker"))
     form = arguments.get("form")
     limit = arguments.get("limit", 10)
     
@@ -275,32 +518,51 @@ async def handle_get_company_filings(arguments: Dict[str, Any]) -> List[TextCont
         return [TextContent(type="text", text="Ticker is required")]
     
     try:
-        company = Company(ticker)
-        filings = company.get_filings()
+        filings = await _run_blocking(_get_filtered, ticker, form or None)
         
-        if form:
-            filings = filings.filter(form=form)
-        
-        results = []
-        for filing in filings[:limit]:
-            filing_data = {
+        page = filings.head(limit)
+        results = [None] * len(page)
+        for i, filing in enumerate(page):
+            try:
+                filing_date = filing.filing_date.isoformat()
+            except AttributeError:
+                filing_date = 'N/A'
+            try:
+                # report_date comes from the filings index; period_of_report fetches the filing homepage
+                period_of_report = filing.report_date
+            except AttributeError:
+                period_of_report = getattr(filing, 'period_of_report', 'N/A')
+            results[i] = {
                 "form": filing.form,
-                "filing_date": filing.filing_date.isoformat() if hasattr(filing, 'filing_date') else 'N/A',
-                "accession_number": getattr(filing, 'accession_number', 'N/A'),
-                "period_of_report": getattr(filing, 'period_of_report', 'N/A'),
+                "filing_date": filing_date,
+                "accession_number": filing.accession_number,
+                "period_of_report": period_of_report,
             }
-            results.append(filing_data)
         
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return [TextContent(type="text", text=_dumps(results))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting filings: {str(e)}")]
 
 
+def _load_filing_text(ticker: str, filing: Any) -> str:
+    """Get the leading text of a filing, one character past MAX_TEXT_CHARS so truncation is detectable"""
+    accession_number = filing.accession_number
+    cached = FILE_CACHE.get(ticker, accession_number, "txt")
+    if cached is not None:
+        return cached.decode()[:MAX_TEXT_CHARS + 1]
+    full_text = filing.text()
+    text = full_text[:MAX_TEXT_CHARS + 1]
+    # Release the full document before encoding; only the prefix is ever returned
+    del full_text
+    FILE_CACHE.set(ticker, accession_number, "txt", text.encode())
+    return text
+
+
 async def handle_get_filing_text(arguments: Dict[str, Any]) -> List[TextContent]:
     """Extract text from a specific filing"""
     ensure_identity()
     
-    ticker = arguments.get("ticker")
+    ticker = _normalize_ticker(arguments.get("ticker"))
     form = arguments.get("form")
     filing_index = arguments.get("filing_index", 0)
     
@@ -308,45 +570,58 @@ async def handle_get_filing_text(arguments: Dict[str, Any]) -> List[TextContent]
         return [TextContent(type="text", text="Ticker and form are required")]
     
     try:
-        company = Company(ticker)
-        filings = company.get_filings().filter(form=form)
+        filings = await _run_blocking(_get_filtered, ticker, form)
         
-        if filing_index >= len(filings):
+        try:
+            filing = filings[filing_index]
+        except (IndexError, KeyError):
             return [TextContent(type="text", text=f"Filing index {filing_index} out of range")]
+        text = await _run_blocking(_load_filing_text, ticker, filing)
         
-        filing = filings[filing_index]
-        text = filing.text()
-        
-        return [TextContent(type="text", text=text[:10000] + "..." if len(text) > 10000 else text)]
+        return [TextContent(type="text", text=text[:MAX_TEXT_CHARS] + "..." if len(text) > MAX_TEXT_CHARS else text)]
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting filing text: {str(e)}")]
 
 
+def _load_insider_transaction(ticker: str, filing: Any) -> Optional[bytes]:
+    """Fetch a single Form 4 filing as JSON, returning None if it cannot be parsed"""
+    try:
+        accession_number = filing.accession_number
+        cached = FILE_CACHE.get(ticker, accession_number, "json")
+        if cached is not None:
+            return cached
+        encoded = orjson.dumps(filing.obj(), default=_object_default, option=_JSON_BASE_OPTIONS)
+    except Exception as e:
+        logger.warning(f"Error processing insider filing: {str(e)}")
+        return None
+    FILE_CACHE.set(ticker, accession_number, "json", encoded)
+    return encoded
+
+
 async def handle_get_insider_transactions(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get insider transaction data"""
     ensure_identity()
     
-    ticker = arguments.get("ticker")
+    ticker = _normalize_ticker(arguments.get("ticker"))
     limit = arguments.get("limit", 20)
     
     if not ticker:
         return [TextContent(type="text", text="Ticker is required")]
     
     try:
-        company = Company(ticker)
-        insider_filings = company.get_filings().filter(form="4")
+        insider_filings = await _run_blocking(_get_filtered, ticker, "4")
         
-        results = []
-        for filing in insider_filings[:limit]:
-            try:
-                insider_data = filing.obj()
-                transaction_data = serialize_filing_data(insider_data)
-                results.append(transaction_data)
-            except Exception as e:
-                logger.warning(f"Error processing insider filing: {str(e)}")
-                continue
+        results = await asyncio.gather(*(
+            _run_blocking(_load_insider_transaction, ticker, filing)
+            for filing in insider_filings[:limit]
+        ))
+        # Each filing is already encoded compactly; embed the bytes as-is unless they need indenting
+        if PRETTY_JSON:
+            results = [orjson.loads(result) for result in results if result is not None]
+        else:
+            results = [orjson.Fragment(result) for result in results if result is not None]
         
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return [TextContent(type="text", text=_dumps(results))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting insider transactions: {str(e)}")]
 
@@ -355,7 +630,7 @@ async def handle_get_financial_statements(arguments: Dict[str, Any]) -> List[Tex
     """Extract financial statements from filings"""
     ensure_identity()
     
-    ticker = arguments.get("ticker")
+    ticker = _normalize_ticker(arguments.get("ticker"))
     form = arguments.get("form")
     filing_index = arguments.get("filing_index", 0)
     
@@ -363,30 +638,53 @@ async def handle_get_financial_statements(arguments: Dict[str, Any]) -> List[Tex
         return [TextContent(type="text", text="Ticker and form are required")]
     
     try:
-        company = Company(ticker)
-        filings = company.get_filings().filter(form=form)
+        filings = await _run_blocking(_get_filtered, ticker, form)
         
-        if filing_index >= len(filings):
+        try:
+            filing = filings[filing_index]
+        except (IndexError, KeyError):
             return [TextContent(type="text", text=f"Filing index {filing_index} out of range")]
+        # obj() downloads and parses the filing, and to_dict() may load more data
+        financial_data = await _run_blocking(lambda: serialize_filing_data(filing.obj()))
         
-        filing = filings[filing_index]
-        financials = filing.obj()
-        
-        financial_data = serialize_filing_data(financials)
-        
-        return [TextContent(type="text", text=json.dumps(financial_data, indent=2))]
+        return [TextContent(type="text", text=_dumps(financial_data))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting financial statements: {str(e)}")]
 
 
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]] = {
+    "get_company_info": handle_get_company_info,
+    "get_company_filings": handle_get_company_filings,
+    "get_filing_text": handle_get_filing_text,
+    "get_insider_transactions": handle_get_insider_transactions,
+    "get_financial_statements": handle_get_financial_statements,
+}
+
+
+async def _warmup():
+    """Prime edgartools, the HTTP connection pool and the filings cache"""
+    try:
+        await _run_blocking(_get_filtered, "AAPL", "10-K")
+        logger.info("Warm-up complete")
+    except Exception as e:
+        logger.warning(f"Warm-up failed: {str(e)}")
+
+
 async def main():
     """Main server entry point"""
     async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+        warmup_task = None
+        if EDGARTOOLS_AVAILABLE and os.getenv('EDGAR_WARMUP') == '1':
+            warmup_task = asyncio.create_task(_warmup())
+        try:
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+        finally:
+            if warmup_task is not None:
+                warmup_task.cancel()
 
 
 if __name__ == "__main__":